@@ -4,6 +4,14 @@ SecureCartography v2 - Export Module
 Export network topology to various formats.
 """
 
-from .graphml_exporter import GraphMLExporter
-
 __all__ = ["GraphMLExporter"]
+
+
+def __getattr__(name):
+    # PEP 562 lazy import: keeps `import sc2.export` (and the CLI's --help
+    # path) from paying for the exporter's XML/base64/resource machinery
+    # until GraphMLExporter is actually used.
+    if name == "GraphMLExporter":
+        from .graphml_exporter import GraphMLExporter
+        return GraphMLExporter
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
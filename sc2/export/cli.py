@@ -17,10 +17,98 @@ Usage:
 
 import argparse
 import json
+import mmap
+import os
 import sys
 from pathlib import Path
 
-from .graphml_exporter import GraphMLExporter
+# Fastest available JSON parser, picked at import time: orjson (Rust),
+# then msgspec, then ujson (both C), then the stdlib. All are optional -
+# the CLI works with the stdlib alone, just slower on big topologies.
+# _LOADS_ACCEPTS_BUFFER marks parsers that take any bytes-like buffer
+# (e.g. a memoryview over an mmap) rather than bytes/str only.
+try:
+    import orjson
+    _loads = orjson.loads
+    _DECODE_ERRORS = (orjson.JSONDecodeError, json.JSONDecodeError)
+    _LOADS_ACCEPTS_BUFFER = True
+except ImportError:
+    try:
+        import msgspec.json
+        _loads = msgspec.json.decode
+        _DECODE_ERRORS = (msgspec.DecodeError, json.JSONDecodeError)
+        _LOADS_ACCEPTS_BUFFER = True
+    except ImportError:
+        try:
+            import ujson
+            _loads = ujson.loads
+            _DECODE_ERRORS = (ValueError,)
+            _LOADS_ACCEPTS_BUFFER = False
+        except ImportError:
+            _loads = json.loads
+            _DECODE_ERRORS = (json.JSONDecodeError,)
+            _LOADS_ACCEPTS_BUFFER = False
+
+# With msgspec installed, decode against a dict[str, dict] schema so the
+# topology's shape - string hostnames mapping to node dicts - is
+# validated in C during the parse itself. A full msgspec.Struct schema
+# would hand the exporter Struct instances instead of the plain dicts it
+# (and every caller) expects, so the schema stays at the container
+# level. Note _decode_topology then parses via msgspec regardless of
+# which tier above won; _loads only matters when msgspec is absent.
+# DecodeError covers both malformed JSON and its ValidationError
+# subclass for schema failures.
+try:
+    import msgspec
+    _DECODE_ERRORS = (msgspec.DecodeError,) + _DECODE_ERRORS
+except ImportError:
+    msgspec = None
+
+
+def _decode_topology(buf):
+    """Parse a topology payload, validating its shape when msgspec is present."""
+    if msgspec is not None:
+        return msgspec.json.decode(buf, type=dict[str, dict])
+    return _loads(buf)
+
+# Validated by hand in cmd_graphml: an O(1) frozenset probe instead of
+# argparse's choices= list scan and error formatter.
+_LAYOUTS = frozenset(('grid', 'circle', 'list'))
+
+# Inputs at or above this size are memory-mapped instead of read into a
+# bytes buffer, so the parser consumes kernel page-cache pages directly.
+_MMAP_THRESHOLD = 16 << 20
+
+
+def _load_topology_file(path: Path):
+    """Parse a topology JSON file, memory-mapping large inputs.
+
+    mmap avoids the userspace copy of the whole file that read() would
+    make before parsing; orjson accepts the buffer directly. Small files
+    (and the stdlib fallback, which only takes bytes/str) use a plain read.
+    """
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if _LOADS_ACCEPTS_BUFFER and size >= _MMAP_THRESHOLD:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            mv = memoryview(mm)
+            try:
+                # The parser scans the buffer front to back exactly once;
+                # tell the kernel so it reads ahead aggressively and drops
+                # pages behind the scan. No-op where unsupported (Windows).
+                if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                if hasattr(mmap, 'MADV_WILLNEED'):
+                    mm.madvise(mmap.MADV_WILLNEED)
+                return _decode_topology(mv)
+            finally:
+                # Release the view before closing: an in-flight parse
+                # error's traceback keeps it alive, and closing an mmap
+                # with exported views raises BufferError, masking the
+                # real exception.
+                mv.release()
+                mm.close()
+        return _decode_topology(f.read())
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -64,13 +152,13 @@ Examples:
     graphml_parser.add_argument(
         'input',
         type=Path,
-        help='Input topology JSON file (map.json)'
+        help="Input topology JSON file (map.json), or '-' for stdin"
     )
-    
+
     graphml_parser.add_argument(
         'output',
         type=Path,
-        help='Output GraphML file path'
+        help="Output GraphML file path, or '-' for stdout"
     )
     
     graphml_parser.add_argument(
@@ -99,9 +187,8 @@ Examples:
     
     graphml_parser.add_argument(
         '--layout',
-        choices=['grid', 'circle', 'list'],
         default='grid',
-        help='Initial layout algorithm (default: grid)'
+        help='Initial layout algorithm: grid, circle or list (default: grid)'
     )
     
     graphml_parser.add_argument(
@@ -116,22 +203,55 @@ Examples:
         default='Dialog',
         help='Font family for labels (default: Dialog)'
     )
-    
+
+    graphml_parser.add_argument(
+        '--stream',
+        action='store_true',
+        help='Stream-parse the input with ijson (bounds memory on huge files)'
+    )
+
     return parser
 
 
 def cmd_graphml(args) -> int:
     """Execute GraphML export command."""
-    # Validate input file
-    if not args.input.exists():
-        print(f"ERROR: Input file not found: {args.input}", file=sys.stderr)
+    # Deferred so --help/arg errors never pay the exporter's import cost
+    from .graphml_exporter import GraphMLExporter
+
+    # Validate options
+    if args.layout not in _LAYOUTS:
+        print(f"ERROR: Invalid layout: {args.layout} "
+              f"(expected one of: {', '.join(sorted(_LAYOUTS))})", file=sys.stderr)
         return 1
-    
-    # Load topology JSON
+
+    # '-' composes into shell pipelines without staging tempfiles
+    from_stdin = str(args.input) == '-'
+    to_stdout = str(args.output) == '-'
+
+    # Load topology JSON (binary mode - orjson consumes bytes directly).
+    # No exists() pre-check: the open itself reports a missing file, which
+    # saves a stat() per run and avoids the check/open race.
     try:
-        with open(args.input, 'r') as f:
-            topology = json.load(f)
-    except json.JSONDecodeError as e:
+        if from_stdin:
+            topology = _decode_topology(sys.stdin.buffer.read())
+        elif args.stream:
+            # Incremental SAX-style parse: never materializes the raw JSON
+            # text or an intermediate parse buffer, so peak memory stays
+            # bounded by the topology dict itself on multi-GB inputs.
+            try:
+                import ijson
+            except ImportError:
+                print("ERROR: --stream requires the 'ijson' package "
+                      "(pip install ijson)", file=sys.stderr)
+                return 1
+            with open(args.input, 'rb') as f:
+                topology = dict(ijson.kvitems(f, ''))
+        else:
+            topology = _load_topology_file(args.input)
+    except FileNotFoundError:
+        print(f"ERROR: Input file not found: {args.input}", file=sys.stderr)
+        return 1
+    except _DECODE_ERRORS as e:
         print(f"ERROR: Invalid JSON in {args.input}: {e}", file=sys.stderr)
         return 1
     except Exception as e:
@@ -161,28 +281,42 @@ def cmd_graphml(args) -> int:
     
     # Export topology
     try:
-        exporter.export(topology, args.output)
+        exporter.export(topology, sys.stdout.buffer if to_stdout else args.output)
     except Exception as e:
         print(f"ERROR: Export failed: {e}", file=sys.stderr)
         import traceback
         traceback.print_exc()
         return 1
     
-    # Success - print summary
-    print(f"✓ Exported to {args.output}")
-    print(f"  Nodes: {len(topology)}")
-    print(f"  Icons: {'enabled' if not args.no_icons else 'disabled'}")
-    print(f"  Layout: {args.layout}")
-    print(f"  Endpoints: {'included' if not args.no_endpoints else 'excluded'}")
+    # Success - print summary (to stderr when stdout carries the GraphML)
+    summary = sys.stderr if to_stdout else sys.stdout
+    print(f"✓ Exported to {'<stdout>' if to_stdout else args.output}", file=summary)
+    print(f"  Nodes: {len(topology)}", file=summary)
+    print(f"  Icons: {'enabled' if not args.no_icons else 'disabled'}", file=summary)
+    print(f"  Layout: {args.layout}", file=summary)
+    print(f"  Endpoints: {'included' if not args.no_endpoints else 'excluded'}", file=summary)
     if args.connected_only:
-        print(f"  Filter: connected devices only")
-    
+        print(f"  Filter: connected devices only", file=summary)
+
     return 0
 
 
+# Parser construction is not free (a dozen add_argument calls plus help
+# formatting); cache it so programmatic callers invoking main() repeatedly
+# only build it once per process.
+_PARSER = None
+
+
+def _get_parser() -> argparse.ArgumentParser:
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = create_parser()
+    return _PARSER
+
+
 def main(argv=None):
     """Main entry point."""
-    parser = create_parser()
+    parser = _get_parser()
     args = parser.parse_args(argv)
     
     if not args.format:
@@ -12,13 +12,15 @@ Usage:
 """
 
 import base64
+import functools
 import json
+import math
 import re
 import xml.etree.ElementTree as ET
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
-from xml.dom import minidom
+from xml.sax.saxutils import escape, quoteattr
 
 from sc2.scng.utils.resource_helper import (
     read_resource_bytes,
@@ -27,19 +29,188 @@ from sc2.scng.utils.resource_helper import (
     resource_exists, read_resource_text
 )
 
-@dataclass
-class Connection:
-    """Represents a single port-to-port connection."""
-    local_port: str
-    remote_port: str
+# Static document skeleton, written verbatim around the streamed elements.
+_XML_DECLARATION = b"<?xml version='1.0' encoding='utf-8'?>\n"
+_GRAPHML_OPEN = (
+    b'<graphml xmlns="http://graphml.graphdrawing.org/xmlns"'
+    b' xmlns:java="http://www.yworks.com/xml/yfiles-common/1.0/java"'
+    b' xmlns:sys="http://www.yworks.com/xml/yfiles-common/markup/primitives/2.0"'
+    b' xmlns:x="http://www.yworks.com/xml/yfiles-common/markup/2.0"'
+    b' xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"'
+    b' xmlns:y="http://www.yworks.com/xml/graphml"'
+    b' xmlns:yed="http://www.yworks.com/xml/yed/3"'
+    b' xsi:schemaLocation="http://graphml.graphdrawing.org/xmlns'
+    b' http://www.yworks.com/xml/schema/graphml/1.1/ygraphml.xsd">\n'
+)
+_GRAPHML_CLOSE = b'</graphml>\n'
+_GRAPH_OPEN = b'  <graph id="G" edgedefault="directed">\n'
+_GRAPH_CLOSE = b'  </graph>\n'
+
+# GraphML key definitions: (for, id, attr.name, attr.type, yfiles.type)
+_KEY_DEFS = (
+    ("graph", "d0", "Description", "string", None),
+    ("port", "d1", None, None, "portgraphics"),
+    ("port", "d2", None, None, "portgeometry"),
+    ("port", "d3", None, None, "portuserdata"),
+    ("node", "d4", "url", "string", None),
+    ("node", "d5", "description", "string", None),
+    ("node", "d6", None, None, "nodegraphics"),
+    ("graphml", "d7", None, None, "resources"),
+    ("edge", "d8", "url", "string", None),
+    ("edge", "d9", "description", "string", None),
+    ("edge", "d10", None, None, "edgegraphics"),
+)
+
+
+def _render_keys() -> bytes:
+    """Render the key section once; it is identical for every export."""
+    parts = []
+    for target, key_id, name, attr_type, yfiles_type in _KEY_DEFS:
+        attrib = {"for": target, "id": key_id}
+        if name:
+            attrib["attr.name"] = name
+        if attr_type:
+            attrib["attr.type"] = attr_type
+        if yfiles_type:
+            attrib["yfiles.type"] = yfiles_type
+        parts.append(b'  ' + ET.tostring(ET.Element("key", attrib)) + b'\n')
+    return b''.join(parts)
+
+
+_KEYS_XML = _render_keys()
+
+# Per-node templates: nodes are write-only, so a single format() producing
+# the whole block replaces ~10 Element/attrib-dict allocations per node.
+# Dynamic values are escaped/quoted by the caller.
+_IMAGE_NODE_TMPL = '''\
+    <node id={node_id}>
+      <data key="d6">
+        <y:ImageNode>
+          <y:Geometry height="51.0" width="90.0" x="{x}" y="{y}" />
+          <y:Fill color="#CCCCFF" transparent="false" />
+          <y:BorderStyle color="#000000" type="line" width="1.0" />
+          <y:NodeLabel alignment="center" autoSizePolicy="content" \
+fontFamily={font_family} fontSize="{font_size}" fontStyle="plain" \
+hasBackgroundColor="false" hasLineColor="false" modelName="eight_pos" \
+modelPosition="s" textColor="#333333" visible="true">{label}</y:NodeLabel>
+          <y:Image refid="{icon_id}" />
+        </y:ImageNode>
+      </data>
+    </node>
+'''
+
+_EDGE_TMPL = '''\
+    <edge id="{edge_id}" source={source} target={target}>
+      <data key="d10">
+        <y:PolyLineEdge>
+          <y:LineStyle color="#000000" type="line" width="1.0" />
+          <y:Arrows source="none" target="none" />
+          <y:EdgeLabel alignment="center" backgroundColor="#FFFFFF" \
+configuration="AutoFlippingLabel" fontFamily={font_family} \
+fontSize="{font_size}" fontStyle="plain" hasLineColor="false" \
+modelName="free" modelPosition="anywhere" textColor="#000000" \
+visible="true" distance="10.0" ratio="0.2" \
+preferredPlacement="source_on_edge">{local_port}</y:EdgeLabel>
+          <y:EdgeLabel alignment="center" backgroundColor="#FFFFFF" \
+configuration="AutoFlippingLabel" fontFamily={font_family} \
+fontSize="{font_size}" fontStyle="plain" hasLineColor="false" \
+modelName="free" modelPosition="anywhere" textColor="#000000" \
+visible="true" distance="10.0" ratio="0.8" \
+preferredPlacement="target_on_edge">{remote_port}</y:EdgeLabel>
+          <y:BendStyle smoothed="false" />
+        </y:PolyLineEdge>
+      </data>
+    </edge>
+'''
+
+_SHAPE_NODE_TMPL = '''\
+    <node id={node_id}>
+      <data key="d6">
+        <y:ShapeNode>
+          <y:Geometry height="60" width="120" x="{x}" y="{y}" />
+          <y:Fill color="#FFFFFF" transparent="false" />
+          <y:BorderStyle color="#000000" type="line" width="1.0" />
+          <y:Shape type="roundrectangle" />
+          <y:NodeLabel alignment="center" autoSizePolicy="content" \
+fontFamily={font_family} fontSize="{font_size}" modelName="internal" \
+modelPosition="c" textColor="#000000" visible="true">{label}</y:NodeLabel>
+        </y:ShapeNode>
+      </data>
+    </node>
+'''
+
+
+def _chunk_b64(icon_bytes: bytes) -> str:
+    """Encode icon bytes as base64 pre-chunked into 76-char lines.
+
+    yEd's resource blocks want MIME-style line breaks, which is exactly
+    what encodebytes emits - one C-level pass instead of encode plus a
+    Python-level slice-and-join. Chunking once at load time means the
+    cached text is written verbatim per export. ASCII decode, since
+    base64 output can't contain multibyte sequences.
+    """
+    return base64.encodebytes(icon_bytes).decode('ascii').rstrip('\n')
+
+
+@functools.lru_cache(maxsize=None)
+def _prefetch_package_icons(package: str) -> Dict[str, str]:
+    """Read and encode every icon in a resources package, keyed by stem.
+
+    One directory listing replaces the up-to-three importlib probes (one
+    per extension) that a lazy per-icon lookup pays - in a wheel each
+    probe is a zip-archive seek. Cached per package so the sweep runs
+    once per process; returns an empty dict when the package is missing.
+    """
+    blobs: Dict[str, str] = {}
+    try:
+        for name, read_fn in iterate_resources(package):
+            stem, dot, ext = name.rpartition('.')
+            if dot and ext.lower() in ('jpg', 'jpeg', 'png') and stem not in blobs:
+                blobs[stem] = _chunk_b64(read_fn())
+    except Exception:
+        pass
+    return blobs
+
+
+@functools.lru_cache(maxsize=None)
+def _load_icon_b64(package: Optional[str], icons_dir: Optional[str], base_name: str) -> Optional[str]:
+    """Load an icon by stem and return its chunked base64 text, or None.
+
+    Tries package resources first (works in wheels), then the filesystem.
+    Cached at module level so every exporter instance - and every export
+    run - shares a single load/encode per distinct icon file.
+    """
+    # Try package resources first (works in wheels)
+    if package:
+        b64 = _prefetch_package_icons(package).get(base_name)
+        if b64 is not None:
+            return b64
+
+    # Fallback to filesystem path
+    if icons_dir:
+        for ext in ('.jpg', '.jpeg', '.png'):
+            icon_path = Path(icons_dir) / f"{base_name}{ext}"
+            if icon_path.exists():
+                try:
+                    with open(icon_path, 'rb') as f:
+                        return _chunk_b64(f.read())
+                except IOError as e:
+                    print(f"Warning: Could not load icon {icon_path}: {e}")
+
+    return None
 
 
 @dataclass
 class Edge:
-    """Represents an edge between two nodes."""
+    """Represents an edge between two nodes.
+
+    connections holds the raw (local_port, remote_port) pairs straight
+    from the topology - they are read exactly once during formatting, so
+    wrapping each in an object would be allocation for its own sake.
+    """
     source: str
     target: str
-    connections: List[Connection]
+    connections: List[Tuple[str, str]]
 
 
 @dataclass
@@ -133,6 +304,9 @@ class GraphMLExporter:
         self.layout_type = layout_type
         self.font_size = font_size
         self.font_family = font_family
+        # Rendered once; every node and edge label reuses the same strings
+        self._font_family_attr = quoteattr(font_family)
+        self._font_size_str = str(font_size)
 
         # Resolve icons directory using importlib.resources
         self._icons_package = None  # Package path for importlib.resources
@@ -160,8 +334,13 @@ class GraphMLExporter:
         self.patterns = self.DEFAULT_PATTERNS.copy()
         self.default_icons = self.DEFAULT_ICONS.copy()
         self._load_icon_config()
+        self._compile_patterns()
+        self._icon_file_cache: Dict[Tuple[str, str], Tuple[str, ...]] = {}
         self.processed_connections: Set[tuple] = set()
+        self._edge_counter = 0
         self.mac_pattern = re.compile(r'^([0-9a-f]{4}\.){2}[0-9a-f]{4}$', re.IGNORECASE)
+        # One C-level scan instead of a per-call keyword set + generator
+        self._endpoint_re = re.compile('endpoint|camera|phone|printer|pc|workstation')
 
     def _load_icon_config(self):
         """Load icon configuration from JSON if available."""
@@ -197,39 +376,37 @@ class GraphMLExporter:
             except json.JSONDecodeError as e:
                 print(f"Warning: Could not parse icon config: {e}")
 
+    def _compile_patterns(self):
+        """Prepare the platform patterns for matching.
+
+        The alternation regex is a prefilter only: one C-level search
+        decides whether any pattern matches at all, which is the common
+        negative case. Candidate selection itself walks the lowered
+        pattern list in dict order, because priority is dict order (not
+        the regex's leftmost-match order) and a matched icon file that
+        fails to load must fall through to the next matching pattern.
+        """
+        self._patterns_lower = tuple(
+            (pattern.lower(), icon_file)
+            for pattern, icon_file in self.patterns.items()
+        )
+        self._pattern_re = re.compile('|'.join(
+            re.escape(pattern) for pattern, _ in self._patterns_lower
+        ))
+
     def _load_icon(self, filename: str) -> Optional[str]:
         """Load and cache an icon file as base64."""
         if filename in self.icons:
             return self.icons[filename]
 
-        base_name = Path(filename).stem
-
-        # Try package resources first (works in wheels)
-        if self._icons_package:
-            for ext in ['.jpg', '.jpeg', '.png']:
-                resource_name = f"{base_name}{ext}"
-                try:
-                    icon_bytes = read_resource_bytes(self._icons_package, resource_name)
-                    b64_data = base64.b64encode(icon_bytes).decode('utf-8')
-                    self.icons[filename] = b64_data
-                    return b64_data
-                except Exception:
-                    continue
-
-        # Fallback to filesystem path
-        if self.icons_dir:
-            for ext in ['.jpg', '.jpeg', '.png']:
-                icon_path = self.icons_dir / f"{base_name}{ext}"
-                if icon_path.exists():
-                    try:
-                        with open(icon_path, 'rb') as f:
-                            b64_data = base64.b64encode(f.read()).decode('utf-8')
-                            self.icons[filename] = b64_data
-                            return b64_data
-                    except IOError as e:
-                        print(f"Warning: Could not load icon {icon_path}: {e}")
-
-        return None
+        b64_data = _load_icon_b64(
+            self._icons_package,
+            str(self.icons_dir) if self.icons_dir else None,
+            Path(filename).stem
+        )
+        if b64_data is not None:
+            self.icons[filename] = b64_data
+        return b64_data
 
 
 
@@ -246,46 +423,76 @@ class GraphMLExporter:
         platform_lower = platform.lower() if platform else ''
         node_id_lower = node_id.lower()
 
-        # Try platform patterns first
-        for pattern, icon_file in self.patterns.items():
-            if pattern.lower() in platform_lower or pattern.lower() in node_id_lower:
-                icon_data = self._load_icon(icon_file)
-                if icon_data:
-                    # Get or assign icon ID
-                    if icon_file not in self.icon_id_map:
-                        self.icon_id_map[icon_file] = self.next_icon_id
-                        self.next_icon_id += 1
-                    return icon_data, self.icon_id_map[icon_file]
-
-        # Fall back to default based on node type
-        if self._is_endpoint(node_id, platform):
-            default_file = self.default_icons.get('default_endpoint', 'pc.jpg')
-        elif 'router' in node_id_lower or 'rtr' in node_id_lower:
-            default_file = self.default_icons.get('default_router', 'router.jpg')
-        elif 'switch' in node_id_lower or 'sw' in node_id_lower:
-            default_file = self.default_icons.get('default_switch', 'workgroup_switch.jpg')
-        else:
-            default_file = self.default_icons.get('default_unknown', 'cloud.jpg')
-
-        icon_data = self._load_icon(default_file)
+        # Pattern matches first, in dict order, trying each candidate
+        # until one icon actually loads (generic DEFAULT_PATTERNS entries
+        # can name icons the config's specific patterns supersede). The
+        # type-based default only runs when every candidate fails, so
+        # endpoint classification stays off the pattern-hit path entirely.
+        for icon_file in self._pattern_icon_files(platform_lower, node_id_lower):
+            icon_data = self._load_icon(icon_file)
+            if icon_data:
+                return icon_data, self._icon_id_for(icon_file)
+
+        icon_file = self._default_icon_file(node_id_lower, platform_lower)
+        icon_data = self._load_icon(icon_file)
         if icon_data:
-            if default_file not in self.icon_id_map:
-                self.icon_id_map[default_file] = self.next_icon_id
-                self.next_icon_id += 1
-            return icon_data, self.icon_id_map[default_file]
+            return icon_data, self._icon_id_for(icon_file)
 
         return None, None
 
+    def _icon_id_for(self, icon_file: str) -> int:
+        """Get or assign the resource id for an icon file - one dict probe."""
+        icon_id = self.icon_id_map.get(icon_file)
+        if icon_id is None:
+            icon_id = self.next_icon_id
+            self.icon_id_map[icon_file] = icon_id
+            self.next_icon_id += 1
+        return icon_id
+
+    def _pattern_icon_files(self, platform_lower: str, node_id_lower: str) -> Tuple[str, ...]:
+        """Resolve the pattern-matched icon filenames, in dict order.
+
+        Empty when no pattern matches; the alternation prefilter skips
+        the per-pattern scan for that (common) case. Pure in its
+        (already lowercased) inputs, so candidate tuples are memoized on
+        the instance - repeated exports and nodes sharing platform and
+        name strings skip the scans entirely.
+        """
+        key = (platform_lower, node_id_lower)
+        cached = self._icon_file_cache.get(key)
+        if cached is None:
+            if (self._pattern_re.search(platform_lower)
+                    or self._pattern_re.search(node_id_lower)):
+                cached = tuple(
+                    icon_file for pattern, icon_file in self._patterns_lower
+                    if pattern in platform_lower or pattern in node_id_lower
+                )
+            else:
+                cached = ()
+            self._icon_file_cache[key] = cached
+        return cached
+
+    def _default_icon_file(self, node_id_lower: str, platform_lower: str) -> str:
+        """Pick the type-based default icon for a node with no pattern match."""
+        if self._is_endpoint(node_id_lower, platform_lower):
+            return self.default_icons.get('default_endpoint', 'pc.jpg')
+        if 'router' in node_id_lower or 'rtr' in node_id_lower:
+            return self.default_icons.get('default_router', 'router.jpg')
+        if 'switch' in node_id_lower or 'sw' in node_id_lower:
+            return self.default_icons.get('default_switch', 'workgroup_switch.jpg')
+        return self.default_icons.get('default_unknown', 'cloud.jpg')
+
     def _is_endpoint(self, node_id: str, platform: str) -> bool:
         """Determine if a node is an endpoint device."""
-        # MAC address format
-        if self.mac_pattern.match(node_id):
+        # MAC address format (xxxx.xxxx.xxxx). A MAC is exactly 14 chars
+        # with dots at fixed offsets; checking those first skips the regex
+        # engine for the vast majority of node ids.
+        if (len(node_id) == 14 and node_id[4] == '.' and node_id[9] == '.'
+                and self.mac_pattern.match(node_id)):
             return True
 
         # Platform keywords
-        platform_lower = platform.lower() if platform else ''
-        endpoint_keywords = {'endpoint', 'camera', 'phone', 'printer', 'pc', 'workstation'}
-        if any(kw in platform_lower for kw in endpoint_keywords):
+        if platform and self._endpoint_re.search(platform.lower()):
             return True
 
         return False
@@ -306,384 +513,252 @@ class GraphMLExporter:
             if isinstance(node_data, dict) and 'peers' in node_data:
                 referenced.update(node_data['peers'].keys())
 
-        # Add undefined nodes
-        result = data.copy()
-        for node_id in referenced - defined:
-            result[node_id] = {
-                'node_details': {'ip': '', 'platform': ''},
-                'peers': {}
-            }
+        # Add undefined nodes; leave the input dict untouched (and
+        # unduplicated) when there is nothing to add.
+        missing = referenced - defined
+        if missing:
+            result = data.copy()
+            for node_id in missing:
+                result[node_id] = {
+                    'node_details': {'ip': '', 'platform': ''},
+                    'peers': {}
+                }
+        else:
+            result = data
 
-        # Filter endpoints if requested
+        # Apply both filter options in a single rebuild: compute the
+        # exclusion sets up front, then walk the dict once instead of
+        # producing an intermediate filtered copy per option.
+        endpoints = set()
         if not self.include_endpoints:
+            is_endpoint = self._is_endpoint
             endpoints = {
                 nid for nid, ndata in result.items()
-                if self._is_endpoint(nid, ndata.get('node_details', {}).get('platform', ''))
+                if is_endpoint(nid, (ndata.get('node_details') or {}).get('platform', ''))
             }
 
-            filtered = {}
-            for node_id, node_data in result.items():
-                if node_id not in endpoints:
-                    node_copy = node_data.copy()
-                    if 'peers' in node_copy:
-                        node_copy['peers'] = {
-                            pid: pdata for pid, pdata in node_copy['peers'].items()
-                            if pid not in endpoints
-                        }
-                    filtered[node_id] = node_copy
-            result = filtered
-
-        # =============================================================
-        # NEW: Filter standalone nodes if connected_only is True
-        # =============================================================
+        connected_nodes = None
         if self.connected_only:
-            # Build set of all nodes that have at least one connection
+            # Nodes with at least one (surviving) connection, plus the
+            # peers those connections reference.
             connected_nodes = set()
-
             for node_id, node_data in result.items():
-                if isinstance(node_data, dict):
-                    peers = node_data.get('peers', {})
-                    if peers:
-                        # This node has outgoing connections
-                        connected_nodes.add(node_id)
-                        # All its peers are also connected
-                        connected_nodes.update(peers.keys())
-
-            # Filter to only connected nodes
+                if node_id in endpoints or not isinstance(node_data, dict):
+                    continue
+                live_peers = [
+                    pid for pid in node_data.get('peers', {})
+                    if pid not in endpoints
+                ]
+                if live_peers:
+                    connected_nodes.add(node_id)
+                    connected_nodes.update(live_peers)
+
+        if endpoints or connected_nodes is not None:
             filtered = {}
             for node_id, node_data in result.items():
-                if node_id in connected_nodes:
-                    filtered[node_id] = node_data
-
+                if node_id in endpoints:
+                    continue
+                if connected_nodes is not None and node_id not in connected_nodes:
+                    continue
+                if endpoints and isinstance(node_data, dict):
+                    # Only nodes whose peers actually reference an endpoint
+                    # need a copy; the keys()-view intersection is C-level.
+                    peers = node_data.get('peers')
+                    if peers and endpoints & peers.keys():
+                        node_data = node_data.copy()
+                        node_data['peers'] = {
+                            pid: pdata for pid, pdata in peers.items()
+                            if pid not in endpoints
+                        }
+                filtered[node_id] = node_data
             result = filtered
 
         return result
 
-    def _calculate_position(self, idx: int, total: int) -> Tuple[float, float]:
-        """Calculate node position based on layout type."""
+    def _calculate_positions(self, total: int) -> List[Tuple[float, float]]:
+        """Compute every node position up front for the configured layout.
+
+        One batch pass with the per-layout constants (grid column count,
+        circle radius and angle step) derived once, instead of redoing
+        that arithmetic inside a per-node call. numpy would vectorize the
+        trig further but is not a dependency of this project; the single
+        list comprehension is already a negligible slice of export time.
+        """
         if self.layout_type == 'grid':
             cols = max(1, int(total ** 0.5))
-            row = idx // cols
-            col = idx % cols
-            return col * 200.0, row * 150.0
-        elif self.layout_type == 'circle':
-            import math
-            angle = 2 * math.pi * idx / max(1, total)
+            return [((i % cols) * 200.0, (i // cols) * 150.0) for i in range(total)]
+        if self.layout_type == 'circle':
+            step = 2 * math.pi / max(1, total)
             radius = 50 * total / (2 * math.pi)
-            return radius * math.cos(angle), radius * math.sin(angle)
-        else:
-            # Default: vertical list
-            return 0.0, idx * 150.0
+            cos, sin = math.cos, math.sin
+            return [(radius * cos(step * i), radius * sin(step * i)) for i in range(total)]
+        # Default: vertical list
+        return [(0.0, i * 150.0) for i in range(total)]
 
-    def export(self, topology: Dict, output_path: Path) -> None:
+    def export(self, topology: Dict, output_path) -> None:
         """
         Export topology to GraphML file.
 
         Args:
             topology: SC2 map format topology dict
-            output_path: Output file path
+            output_path: Output file path, or an open binary file-like
+                object (e.g. sys.stdout.buffer for pipelines)
         """
         # Reset state
         self.icons.clear()
         self.icon_id_map.clear()
         self.next_icon_id = 1
         self.processed_connections.clear()
+        self._edge_counter = 0
 
         # Preprocess
         data = self._preprocess_topology(topology)
 
-        # Create root element with namespaces
-        root = ET.Element("graphml")
-        root.set("xmlns", "http://graphml.graphdrawing.org/xmlns")
-        root.set("xmlns:java", "http://www.yworks.com/xml/yfiles-common/1.0/java")
-        root.set("xmlns:sys", "http://www.yworks.com/xml/yfiles-common/markup/primitives/2.0")
-        root.set("xmlns:x", "http://www.yworks.com/xml/yfiles-common/markup/2.0")
-        root.set("xmlns:xsi", "http://www.w3.org/2001/XMLSchema-instance")
-        root.set("xmlns:y", "http://www.yworks.com/xml/graphml")
-        root.set("xmlns:yed", "http://www.yworks.com/xml/yed/3")
-        root.set("xsi:schemaLocation",
-                 "http://graphml.graphdrawing.org/xmlns http://www.yworks.com/xml/schema/graphml/1.1/ygraphml.xsd")
-
-        # Add keys
-        self._add_keys(root)
-
-        # Create graph
-        graph = ET.SubElement(root, "graph", id="G", edgedefault="directed")
-
+        if hasattr(output_path, 'write'):
+            # Caller-supplied binary stream (stdout, socket, BytesIO...)
+            self._write_document(output_path, data)
+        else:
+            # Binary write with a 1 MiB buffer: GraphML for a large topology
+            # is megabytes (icons embedded as base64), so the default 8 KiB
+            # buffer would cost thousands of write(2) syscalls.
+            with open(output_path, 'wb', buffering=1 << 20) as f:
+                self._write_document(f, data)
+
+    def _write_document(self, f, data: Dict) -> None:
+        """Stream the GraphML document to an open binary file object.
+
+        The skeleton is written verbatim and each node/edge element is
+        serialized and discarded as it is built, so only one element is
+        ever alive instead of the whole tree.
+        """
         # Track icons used
         icon_resources: Dict[int, str] = {}
 
-        # Add nodes
-        total_nodes = len(data)
+        f.write(_XML_DECLARATION)
+        f.write(_GRAPHML_OPEN)
+        f.write(_KEYS_XML)
+        f.write(_GRAPH_OPEN)
+
+        # Nodes
+        positions = self._calculate_positions(len(data))
         for idx, (node_id, node_data) in enumerate(data.items()):
-            icon_id, icon_data = self._add_node(graph, node_id, node_data, idx, total_nodes)
+            block, icon_id, icon_data = self._format_node(node_id, node_data, positions[idx])
             if icon_id and icon_data:
                 icon_resources[icon_id] = icon_data
+            f.write(block.encode('utf-8'))
 
-        # Add edges
+        # Edges
         for source_id, source_data in data.items():
             if 'peers' not in source_data:
                 continue
             for target_id, peer_data in source_data['peers'].items():
-                connections = [
-                    Connection(local, remote)
-                    for local, remote in peer_data.get('connections', [])
-                ]
+                connections = peer_data.get('connections')
                 if connections:
-                    self._add_edge(graph, Edge(source_id, target_id, connections))
+                    edge = Edge(source_id, target_id, connections)
+                    for block in self._format_edges(edge):
+                        f.write(block.encode('utf-8'))
 
-        # Add icon resources
+        f.write(_GRAPH_CLOSE)
+
+        # Icon resources
         if icon_resources:
-            self._add_resources(root, icon_resources)
-
-        # Write file
-        xml_str = ET.tostring(root, encoding='unicode')
-        pretty_xml = minidom.parseString(xml_str).toprettyxml(indent="  ")
-
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(pretty_xml)
-
-    def _add_keys(self, root: ET.Element) -> None:
-        """Add GraphML key definitions."""
-        keys = [
-            ("graph", "d0", "Description", "string", None),
-            ("port", "d1", None, None, "portgraphics"),
-            ("port", "d2", None, None, "portgeometry"),
-            ("port", "d3", None, None, "portuserdata"),
-            ("node", "d4", "url", "string", None),
-            ("node", "d5", "description", "string", None),
-            ("node", "d6", None, None, "nodegraphics"),
-            ("graphml", "d7", None, None, "resources"),
-            ("edge", "d8", "url", "string", None),
-            ("edge", "d9", "description", "string", None),
-            ("edge", "d10", None, None, "edgegraphics"),
-        ]
-
-        for target, key_id, name, attr_type, yfiles_type in keys:
-            key = ET.SubElement(root, "key")
-            key.set("for", target)
-            key.set("id", key_id)
-            if name:
-                key.set("attr.name", name)
-            if attr_type:
-                key.set("attr.type", attr_type)
-            if yfiles_type:
-                key.set("yfiles.type", yfiles_type)
-
-    def _add_node(
+            self._write_resources(f, icon_resources)
+
+        f.write(_GRAPHML_CLOSE)
+
+    def _format_node(
         self,
-        graph: ET.Element,
         node_id: str,
         node_data: Dict,
-        idx: int,
-        total: int
-    ) -> Tuple[Optional[int], Optional[str]]:
-        """Add a node to the graph, returns (icon_id, icon_data) if icon used."""
-        node = ET.SubElement(graph, "node", id=node_id)
-        data_elem = ET.SubElement(node, "data", key="d6")
-
+        position: Tuple[float, float]
+    ) -> Tuple[str, Optional[int], Optional[str]]:
+        """Format a node block, returns (xml_text, icon_id, icon_data)."""
         details = node_data.get('node_details', {})
         ip = details.get('ip', '')
         platform = details.get('platform', '')
 
-        x, y = self._calculate_position(idx, total)
+        x, y = position
 
         if self.use_icons:
             icon_data, icon_id = self._get_icon_for_node(node_id, platform)
             if icon_data and icon_id:
-                self._add_image_node(data_elem, node_id, ip, platform, x, y, icon_id)
-                return icon_id, icon_data
-
-        # Fallback to shape node
-        self._add_shape_node(data_elem, node_id, ip, platform, x, y)
-        return None, None
-
-    def _add_image_node(
-        self,
-        data_elem: ET.Element,
-        node_id: str,
-        ip: str,
-        platform: str,
-        x: float,
-        y: float,
-        icon_id: int
-    ) -> None:
-        """Add an image-based node."""
-        image_node = ET.SubElement(data_elem, "y:ImageNode")
-
-        # Geometry
-        geom = ET.SubElement(image_node, "y:Geometry")
-        geom.set("height", "51.0")
-        geom.set("width", "90.0")
-        geom.set("x", str(x))
-        geom.set("y", str(y))
-
-        # Fill
-        fill = ET.SubElement(image_node, "y:Fill")
-        fill.set("color", "#CCCCFF")
-        fill.set("transparent", "false")
-
-        # Border
-        border = ET.SubElement(image_node, "y:BorderStyle")
-        border.set("color", "#000000")
-        border.set("type", "line")
-        border.set("width", "1.0")
-
-        # Label
-        label = ET.SubElement(image_node, "y:NodeLabel")
-        label.set("alignment", "center")
-        label.set("autoSizePolicy", "content")
-        label.set("fontFamily", self.font_family)
-        label.set("fontSize", str(self.font_size))
-        label.set("fontStyle", "plain")
-        label.set("hasBackgroundColor", "false")
-        label.set("hasLineColor", "false")
-        label.set("modelName", "eight_pos")
-        label.set("modelPosition", "s")
-        label.set("textColor", "#333333")
-        label.set("visible", "true")
-
-        # Build label text
-        label_parts = [node_id]
-        if ip:
-            label_parts.append(ip)
-        if platform:
-            label_parts.append(platform)
-        label.text = '\n'.join(label_parts)
-
-        # Image reference
-        image = ET.SubElement(image_node, "y:Image")
-        image.set("refid", str(icon_id))
-
-    def _add_shape_node(
-        self,
-        data_elem: ET.Element,
-        node_id: str,
-        ip: str,
-        platform: str,
-        x: float,
-        y: float
-    ) -> None:
-        """Add a shape-based node (fallback when icons disabled/unavailable)."""
-        shape_node = ET.SubElement(data_elem, "y:ShapeNode")
-
-        # Geometry
-        geom = ET.SubElement(shape_node, "y:Geometry")
-        geom.set("height", "60")
-        geom.set("width", "120")
-        geom.set("x", str(x))
-        geom.set("y", str(y))
-
-        # Fill
-        fill = ET.SubElement(shape_node, "y:Fill")
-        fill.set("color", "#FFFFFF")
-        fill.set("transparent", "false")
-
-        # Border
-        border = ET.SubElement(shape_node, "y:BorderStyle")
-        border.set("color", "#000000")
-        border.set("type", "line")
-        border.set("width", "1.0")
-
-        # Shape
-        shape = ET.SubElement(shape_node, "y:Shape")
-        shape.set("type", "roundrectangle")
-
-        # Label
-        label = ET.SubElement(shape_node, "y:NodeLabel")
-        label.set("alignment", "center")
-        label.set("autoSizePolicy", "content")
-        label.set("fontFamily", self.font_family)
-        label.set("fontSize", str(self.font_size))
-        label.set("modelName", "internal")
-        label.set("modelPosition", "c")
-        label.set("textColor", "#000000")
-        label.set("visible", "true")
+                label_parts = [node_id]
+                if ip:
+                    label_parts.append(ip)
+                if platform:
+                    label_parts.append(platform)
+                block = _IMAGE_NODE_TMPL.format(
+                    node_id=quoteattr(node_id),
+                    x=x, y=y,
+                    font_family=self._font_family_attr,
+                    font_size=self._font_size_str,
+                    label=escape('\n'.join(label_parts)),
+                    icon_id=icon_id
+                )
+                return block, icon_id, icon_data
 
+        # Fallback to shape node (note the id/platform/ip label order)
         label_parts = [node_id]
         if platform:
             label_parts.append(platform)
         if ip:
             label_parts.append(ip)
-        label.text = '\n'.join(label_parts)
-
-    def _add_edge(self, graph: ET.Element, edge: Edge) -> None:
-        """Add edges for each connection."""
-        for conn in edge.connections:
-            # Create unique key to avoid duplicates
-            conn_key = tuple(sorted([
-                f"{edge.source}:{conn.local_port}",
-                f"{edge.target}:{conn.remote_port}"
-            ]))
+        block = _SHAPE_NODE_TMPL.format(
+            node_id=quoteattr(node_id),
+            x=x, y=y,
+            font_family=self._font_family_attr,
+            font_size=self._font_size_str,
+            label=escape('\n'.join(label_parts))
+        )
+        return block, None, None
+
+    def _format_edges(self, edge: Edge):
+        """Yield a formatted edge block per (deduplicated) connection."""
+        font_family = self._font_family_attr
+        source = quoteattr(edge.source)
+        target = quoteattr(edge.target)
+
+        for local_port, remote_port in edge.connections:
+            # Unique key to avoid duplicates: order the two endpoint pairs
+            # with one C-level tuple comparison - no f-strings, no list,
+            # no sorted() call per connection.
+            a = (edge.source, local_port)
+            b = (edge.target, remote_port)
+            conn_key = (a, b) if a < b else (b, a)
 
             if conn_key in self.processed_connections:
                 continue
             self.processed_connections.add(conn_key)
 
-            edge_id = f"e{hash(conn_key) % 10000000:x}"
-            edge_elem = ET.SubElement(
-                graph, "edge",
-                id=edge_id,
-                source=edge.source,
-                target=edge.target
+            # Sequential ids: hash(conn_key) % 10000000 truncated to ~24
+            # bits, which risks birthday collisions (duplicate ids are
+            # invalid GraphML) around 10^4 edges, and paid a tuple hash
+            # per connection. A counter is collision-free and cheaper.
+            edge_id = f"e{self._edge_counter}"
+            self._edge_counter += 1
+            yield _EDGE_TMPL.format(
+                edge_id=edge_id,
+                source=source,
+                target=target,
+                font_family=font_family,
+                font_size=self._font_size_str,
+                local_port=escape(local_port),
+                remote_port=escape(remote_port)
             )
 
-            data_elem = ET.SubElement(edge_elem, "data", key="d10")
-            polyline = ET.SubElement(data_elem, "y:PolyLineEdge")
-
-            # Line style
-            line = ET.SubElement(polyline, "y:LineStyle")
-            line.set("color", "#000000")
-            line.set("type", "line")
-            line.set("width", "1.0")
-
-            # Arrows (none for undirected)
-            arrows = ET.SubElement(polyline, "y:Arrows")
-            arrows.set("source", "none")
-            arrows.set("target", "none")
-
-            # Port labels
-            self._add_edge_label(polyline, conn.local_port, is_source=True)
-            self._add_edge_label(polyline, conn.remote_port, is_source=False)
-
-            # Bend style
-            bend = ET.SubElement(polyline, "y:BendStyle")
-            bend.set("smoothed", "false")
-
-    def _add_edge_label(self, polyline: ET.Element, port: str, is_source: bool) -> None:
-        """Add a port label to an edge."""
-        label = ET.SubElement(polyline, "y:EdgeLabel")
-        label.set("alignment", "center")
-        label.set("backgroundColor", "#FFFFFF")
-        label.set("configuration", "AutoFlippingLabel")
-        label.set("fontFamily", self.font_family)
-        label.set("fontSize", str(self.font_size))
-        label.set("fontStyle", "plain")
-        label.set("hasLineColor", "false")
-        label.set("modelName", "free")
-        label.set("modelPosition", "anywhere")
-        label.set("textColor", "#000000")
-        label.set("visible", "true")
-        label.set("distance", "10.0")
-        label.set("ratio", "0.2" if is_source else "0.8")
-        label.set("preferredPlacement", "source_on_edge" if is_source else "target_on_edge")
-        label.text = port
-
-    def _add_resources(self, root: ET.Element, icon_resources: Dict[int, str]) -> None:
-        """Add resources section with embedded icons."""
-        resources_data = ET.SubElement(root, "data", key="d7")
-        y_resources = ET.SubElement(resources_data, "y:Resources")
-
+    @staticmethod
+    def _write_resources(f, icon_resources: Dict[int, str]) -> None:
+        """Stream the resources section with embedded icons."""
+        f.write(b'  <data key="d7">\n    <y:Resources>\n')
         for icon_id, b64_data in icon_resources.items():
-            resource = ET.SubElement(y_resources, "y:Resource")
-            resource.set("id", str(icon_id))
-            resource.set("type", "java.awt.image.BufferedImage")
-            resource.set("xml:space", "preserve")
-
-            # Clean and chunk the base64 data
-            clean_data = b64_data.replace('\n', '').replace('\r', '')
-            chunks = [clean_data[i:i+76] for i in range(0, len(clean_data), 76)]
-            resource.text = '\n'.join(chunks)
+            # base64 text contains no XML-special characters, so it can be
+            # written without an escape pass
+            f.write(
+                f'      <y:Resource id="{icon_id}" '
+                f'type="java.awt.image.BufferedImage" '
+                f'xml:space="preserve">{b64_data}</y:Resource>\n'.encode('utf-8')
+            )
+        f.write(b'    </y:Resources>\n  </data>\n')
 
 
 # =============================================================================
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Regenerate MANIFEST.in with a literal include line per shipped asset.
+
+Listing files explicitly lets setuptools consume the manifest in one
+pass, with no glob compilation or repeated tree matching at build time.
+Run after adding or removing asset files; pass --check (as CI does) to
+fail without writing when the manifest is stale.
+"""
+
+import os
+import sys
+
+# Non-Python files shipped with the package (keep in sync with the
+# historical package_data extension set).
+ASSET_EXTS = {'.html', '.css', '.js', '.png', '.jpg', '.jpeg', '.svg',
+              '.ico', '.gif', '.json', '.db'}
+
+HEADER = (
+    "# Generated by tools/refresh_manifest.py - do not edit by hand.\n"
+    "include requirements.txt\n"
+)
+
+
+def render_manifest(root):
+    lines = []
+    for dirpath, dirs, files in os.walk(os.path.join(root, "sc2")):
+        dirs[:] = [d for d in dirs if d != "__pycache__"]
+        for fname in sorted(files):
+            if os.path.splitext(fname)[1].lower() in ASSET_EXTS:
+                rel = os.path.relpath(os.path.join(dirpath, fname), root)
+                lines.append(f"include {rel.replace(os.sep, '/')}\n")
+    lines.sort()
+    return HEADER + "".join(lines)
+
+
+def main(argv=None):
+    args = sys.argv[1:] if argv is None else argv
+    check = "--check" in args
+
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    manifest_path = os.path.join(root, "MANIFEST.in")
+    content = render_manifest(root)
+
+    try:
+        with open(manifest_path, encoding="utf-8") as fh:
+            current = fh.read()
+    except OSError:
+        current = None
+
+    if current == content:
+        print("MANIFEST.in is up to date")
+        return 0
+    if check:
+        print("MANIFEST.in is stale - run tools/refresh_manifest.py",
+              file=sys.stderr)
+        return 1
+
+    with open(manifest_path, "w", encoding="utf-8") as fh:
+        fh.write(content)
+    print(f"updated MANIFEST.in ({content.count(chr(10)) - 2} asset files)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Regenerate the static package list embedded in pyproject.toml.
+
+pyproject.toml ships a literal package list instead of having the build
+backend run discovery on every install. Run this after adding or
+removing a package; pass --check (as CI does) to fail without writing
+when the list is stale.
+"""
+
+import os
+import re
+import sys
+
+from setuptools import find_packages
+
+BEGIN = "# === AUTO-PACKAGES BEGIN ==="
+END = "# === AUTO-PACKAGES END ==="
+
+
+def render_block(packages):
+    lines = [
+        BEGIN,
+        "# Generated by tools/refresh_packages.py - do not edit by hand.",
+        "packages = [",
+    ]
+    lines += [f'    "{pkg}",' for pkg in packages]
+    lines += ["]", END]
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    args = sys.argv[1:] if argv is None else argv
+    check = "--check" in args
+
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    os.chdir(root)
+
+    packages = sorted(find_packages(include=["sc2", "sc2.*"]))
+    block = render_block(packages)
+
+    toml_path = os.path.join(root, "pyproject.toml")
+    with open(toml_path, encoding="utf-8") as fh:
+        src = fh.read()
+
+    pattern = re.compile(re.escape(BEGIN) + r".*?" + re.escape(END), re.S)
+    if not pattern.search(src):
+        print("ERROR: AUTO-PACKAGES markers not found in pyproject.toml", file=sys.stderr)
+        return 2
+
+    new_src = pattern.sub(lambda _: block, src)
+    if new_src == src:
+        print("pyproject.toml package list is up to date")
+        return 0
+    if check:
+        print("pyproject.toml package list is stale - run tools/refresh_packages.py",
+              file=sys.stderr)
+        return 1
+
+    with open(toml_path, "w", encoding="utf-8") as fh:
+        fh.write(new_src)
+    print(f"updated pyproject.toml with {len(packages)} packages")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())